@@ -174,7 +174,9 @@ async def run_autonomous_agent(
         print_session_header(iteration, is_first_run)
 
         # Create client (fresh context)
-        client = create_client(project_dir, model)
+        # Enhancement sessions only add features to the database, so they
+        # skip the Playwright MCP server
+        client = create_client(project_dir, model, use_browser=not is_enhancement_run)
 
         # Choose prompt based on session type
         # Pass project_dir to enable project-specific prompts
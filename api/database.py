@@ -9,7 +9,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, create_engine
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.types import JSON
@@ -21,6 +21,13 @@ class Feature(Base):
     """Feature model representing a test case/feature to implement."""
 
     __tablename__ = "features"
+    __table_args__ = (
+        # Serves feature_get_next (WHERE passes ORDER BY priority, id LIMIT 1)
+        # as an index range scan instead of filter + sort
+        Index("ix_feature_pending_prio", "passes", "priority", "id"),
+        # Serves GROUP BY / DISTINCT on category
+        Index("ix_feature_category", "category"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     priority = Column(Integer, nullable=False, default=999, index=True)
@@ -26,6 +26,8 @@ def migrate_schema(session_maker: sessionmaker) -> None:
     - source: "initializer" | "enhancement"
     - added_at: timestamp when feature was added
     - batch_id: UUID for grouping features added together
+
+    Also creates indexes added after the initial schema.
     """
     session: Session = session_maker()
     try:
@@ -55,6 +57,14 @@ def migrate_schema(session_maker: sessionmaker) -> None:
             )
             print("Added 'batch_id' column to features table")
 
+        # Add query indexes if missing (no-op on databases created with them)
+        session.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_feature_pending_prio ON features (passes, priority, id)")
+        )
+        session.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_feature_category ON features (category)")
+        )
+
         session.commit()
     except Exception as e:
         session.rollback()
@@ -62,6 +72,93 @@ def migrate_schema(session_maker: sessionmaker) -> None:
     finally:
         session.close()
 
+    migrate_feature_fts(session_maker)
+
+
+# Triggers that keep feature_fts in sync with the features table
+FEATURE_FTS_TRIGGERS = ("feature_fts_ai", "feature_fts_ad", "feature_fts_au")
+
+
+def migrate_feature_fts(session_maker: sessionmaker) -> None:
+    """
+    Create the feature_fts full-text index over feature names/descriptions.
+
+    feature_fts is an external-content FTS5 table kept in sync with the
+    features table by triggers. It uses the trigram tokenizer so MATCH keeps
+    the case-insensitive substring semantics of the previous LIKE search.
+    Existing rows are indexed when the table is first created. If the SQLite
+    build lacks FTS5 or the trigram tokenizer, search falls back to LIKE.
+
+    The table, triggers and backfill are created in one explicit transaction
+    (pysqlite would otherwise autocommit each DDL statement), and any partial
+    index left by an interrupted earlier run is dropped first.
+    """
+    if has_feature_fts(session_maker):
+        return
+
+    session: Session = session_maker()
+    try:
+        session.execute(text("BEGIN"))
+        _drop_feature_fts(session)
+        session.execute(text(
+            "CREATE VIRTUAL TABLE feature_fts USING fts5("
+            "name, description, content='features', content_rowid='id', tokenize='trigram')"
+        ))
+        session.execute(text(
+            "CREATE TRIGGER feature_fts_ai AFTER INSERT ON features BEGIN "
+            "INSERT INTO feature_fts(rowid, name, description) "
+            "VALUES (new.id, new.name, new.description); "
+            "END"
+        ))
+        session.execute(text(
+            "CREATE TRIGGER feature_fts_ad AFTER DELETE ON features BEGIN "
+            "INSERT INTO feature_fts(feature_fts, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); "
+            "END"
+        ))
+        session.execute(text(
+            "CREATE TRIGGER feature_fts_au AFTER UPDATE OF name, description ON features BEGIN "
+            "INSERT INTO feature_fts(feature_fts, rowid, name, description) "
+            "VALUES ('delete', old.id, old.name, old.description); "
+            "INSERT INTO feature_fts(rowid, name, description) "
+            "VALUES (new.id, new.name, new.description); "
+            "END"
+        ))
+        # Index rows that existed before the FTS table
+        session.execute(text("INSERT INTO feature_fts(feature_fts) VALUES ('rebuild')"))
+
+        session.commit()
+        print("Created 'feature_fts' full-text index")
+    except Exception as e:
+        session.rollback()
+        print(f"Full-text index unavailable, search will use LIKE: {e}")
+    finally:
+        session.close()
+
+
+def _drop_feature_fts(session: Session) -> None:
+    """Drop the feature_fts table and its sync triggers, if present."""
+    for trigger in FEATURE_FTS_TRIGGERS:
+        session.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    session.execute(text("DROP TABLE IF EXISTS feature_fts"))
+
+
+def has_feature_fts(session_maker: sessionmaker) -> bool:
+    """Return True if the feature_fts full-text index and its triggers exist."""
+    session: Session = session_maker()
+    try:
+        result = session.execute(
+            text(
+                "SELECT name FROM sqlite_master "
+                "WHERE (type = 'table' AND name = 'feature_fts') "
+                "OR (type = 'trigger' AND name IN (:ai, :ad, :au))"
+            ),
+            dict(zip(("ai", "ad", "au"), FEATURE_FTS_TRIGGERS)),
+        )
+        return {row[0] for row in result} == {"feature_fts", *FEATURE_FTS_TRIGGERS}
+    finally:
+        session.close()
+
 
 def migrate_json_to_sqlite(
     project_dir: Path,
@@ -5,23 +5,32 @@ Claude SDK Client Configuration
 Functions for creating and configuring the Claude Agent SDK client.
 """
 
+import copy
 import json
 import os
 import sys
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
+import orjson
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 from claude_agent_sdk.types import HookMatcher
 
 from security import bash_security_hook
 
 
+# Parsed project MCP configs, keyed by (config path, mtime_ns)
+_mcp_config_cache: dict[tuple[str, int], dict] = {}
+
+
 def get_project_mcp_servers(project_dir: Path) -> dict:
     """
     Load project-specific MCP server configuration.
 
     Looks for .claude/mcp_servers.json in the project directory.
     Returns empty dict if file doesn't exist or is invalid.
+    The parsed config is cached until the file's mtime changes.
 
     Args:
         project_dir: The project directory to check
@@ -31,20 +40,29 @@ def get_project_mcp_servers(project_dir: Path) -> dict:
     """
     mcp_config_path = project_dir / ".claude" / "mcp_servers.json"
 
-    if not mcp_config_path.exists():
+    try:
+        mtime_ns = os.stat(mcp_config_path).st_mtime_ns
+    except OSError:
         return {}
 
+    cache_key = (str(mcp_config_path), mtime_ns)
+    cached = _mcp_config_cache.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     try:
         with open(mcp_config_path, "r") as f:
             config = json.load(f)
 
         # Set cwd for each server to project directory (needed for artisan)
-        for server_name, server_config in config.items():
+        project_cwd = str(project_dir.resolve())
+        for server_config in config.values():
             if "cwd" not in server_config:
-                server_config["cwd"] = str(project_dir.resolve())
+                server_config["cwd"] = project_cwd
 
         print(f"[MCP] Loaded project MCP servers: {list(config.keys())}")
-        return config
+        _mcp_config_cache[cache_key] = config
+        return copy.deepcopy(config)
 
     except (json.JSONDecodeError, OSError) as e:
         print(f"[MCP] Warning: Could not load MCP config from {mcp_config_path}: {e}")
@@ -52,7 +70,7 @@ def get_project_mcp_servers(project_dir: Path) -> dict:
 
 
 # Feature MCP tools for feature/test management
-FEATURE_MCP_TOOLS = [
+FEATURE_MCP_TOOLS = tuple(map(sys.intern, (
     "mcp__features__feature_get_stats",
     "mcp__features__feature_get_next",
     "mcp__features__feature_get_for_regression",
@@ -63,10 +81,11 @@ FEATURE_MCP_TOOLS = [
     "mcp__features__feature_get_all_categories",
     "mcp__features__feature_get_summary",
     "mcp__features__feature_search",
-]
+)))
 
 # Laravel Boost MCP tools for Laravel development (all 16 tools)
-LARAVEL_BOOST_TOOLS = [
+# (interned explicitly: CPython doesn't auto-intern hyphenated literals)
+LARAVEL_BOOST_TOOLS = tuple(map(sys.intern, (
     "mcp__laravel-boost__application-info",
     "mcp__laravel-boost__browser-logs",
     "mcp__laravel-boost__database-connections",
@@ -83,10 +102,10 @@ LARAVEL_BOOST_TOOLS = [
     "mcp__laravel-boost__report-feedback",
     "mcp__laravel-boost__search-docs",
     "mcp__laravel-boost__tinker",
-]
+)))
 
 # Playwright MCP tools for browser automation
-PLAYWRIGHT_TOOLS = [
+PLAYWRIGHT_TOOLS = tuple(map(sys.intern, (
     # Core navigation & screenshots
     "mcp__playwright__browser_navigate",
     "mcp__playwright__browser_navigate_back",
@@ -116,26 +135,106 @@ PLAYWRIGHT_TOOLS = [
     "mcp__playwright__browser_handle_dialog",
     "mcp__playwright__browser_file_upload",
     "mcp__playwright__browser_install",
-]
+)))
 
 # Built-in tools
-BUILTIN_TOOLS = [
+BUILTIN_TOOLS = (
     "Read",
     "Write",
     "Edit",
     "Glob",
     "Grep",
     "Bash",
-]
+)
+
+# Project directories already created by this process
+_known_dirs: set[Path] = set()
+
+# MCP tools advertised per server. A server's tools are only allowed (and its
+# schemas only loaded into the session) when that server is actually configured.
+MCP_SERVER_TOOLS = {
+    "features": FEATURE_MCP_TOOLS,
+    "playwright": PLAYWRIGHT_TOOLS,
+    "laravel-boost": LARAVEL_BOOST_TOOLS,
+}
+
+
+# Permission rules that don't depend on the configured MCP servers
+# Note: Using relative paths ("./**") restricts access to project directory
+# since cwd is set to project_dir
+BASE_ALLOW_RULES = (
+    # Allow all file operations within the project directory
+    "Read(./**)",
+    "Write(./**)",
+    "Edit(./**)",
+    "Glob(./**)",
+    "Grep(./**)",
+    # Bash permission granted here, but actual commands are validated
+    # by the bash_security_hook (see security.py for allowed commands)
+    "Bash(*)",
+)
+
+
+@lru_cache(maxsize=None)
+def get_tool_permissions(server_names: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Return the tool allow-lists for a set of configured MCP servers.
+
+    Results are cached per server set, so repeated client builds reuse the
+    same immutable tuples instead of re-concatenating the tool lists.
+
+    Args:
+        server_names: Names of the configured MCP servers, in registration order
+
+    Returns:
+        (allowed_tools, allow_rules) where allowed_tools holds the built-in
+        and MCP tool names and allow_rules holds the settings permission rules
+    """
+    mcp_tools = tuple(chain.from_iterable(
+        MCP_SERVER_TOOLS.get(server_name, ()) for server_name in server_names
+    ))
+    return (*BUILTIN_TOOLS, *mcp_tools), (*BASE_ALLOW_RULES, *mcp_tools)
+
 
+def write_settings_file(settings_file: Path, settings: dict) -> bool:
+    """
+    Write settings as JSON, skipping the write if the file is already current.
+
+    The file is written to a temporary sibling and moved into place, so an
+    interrupted write never leaves a truncated settings file behind.
+
+    Args:
+        settings_file: Path of the settings file
+        settings: Settings to serialize
+
+    Returns:
+        True if the file was written, False if it already had this content
+    """
+    content = orjson.dumps(settings, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    try:
+        if settings_file.read_bytes() == content:
+            return False
+    except OSError:
+        pass  # Missing or unreadable - (re)write it
 
-def create_client(project_dir: Path, model: str):
+    tmp_file = settings_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(content)
+    os.replace(tmp_file, settings_file)
+    return True
+
+
+def create_client(project_dir: Path, model: str, use_browser: bool = True):
     """
     Create a Claude Agent SDK client with multi-layered security.
 
     Args:
         project_dir: Directory for the project
         model: Claude model to use
+        use_browser: Whether to start the Playwright MCP server. Enhancement
+            sessions, which only add features and never verify them in a
+            browser, skip it to avoid spawning npx and loading ~20 unused
+            tool schemas into context.
 
     Returns:
         Configured ClaudeSDKClient (from claude_agent_sdk)
@@ -149,44 +248,9 @@ def create_client(project_dir: Path, model: str):
     Note: Authentication is handled by start.bat/start.sh before this runs.
     The Claude SDK auto-detects credentials from ~/.claude/.credentials.json
     """
-    # Create comprehensive security settings
-    # Note: Using relative paths ("./**") restricts access to project directory
-    # since cwd is set to project_dir
-    security_settings = {
-        "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
-        "permissions": {
-            "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
-            "allow": [
-                # Allow all file operations within the project directory
-                "Read(./**)",
-                "Write(./**)",
-                "Edit(./**)",
-                "Glob(./**)",
-                "Grep(./**)",
-                # Bash permission granted here, but actual commands are validated
-                # by the bash_security_hook (see security.py for allowed commands)
-                "Bash(*)",
-                # Allow Playwright MCP tools for browser automation
-                *PLAYWRIGHT_TOOLS,
-                # Allow Feature MCP tools for feature management
-                *FEATURE_MCP_TOOLS,
-                # Allow Laravel Boost MCP tools for Laravel development
-                *LARAVEL_BOOST_TOOLS,
-            ],
-        },
-    }
-
-    # Ensure project directory exists before creating settings file
-    project_dir.mkdir(parents=True, exist_ok=True)
-
-    # Write settings to a file in the project directory
-    settings_file = project_dir / ".claude_settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
-
-    # Base MCP servers (always included)
+    # Base MCP servers. The features server is a cheap local stdio process;
+    # Playwright is only started for sessions that need browser automation.
     base_mcp_servers = {
-        "playwright": {"command": "npx", "args": ["@playwright/mcp@latest", "--viewport-size", "1280x720"]},
         "features": {
             "command": sys.executable,  # Use the same Python that's running this script
             "args": ["-m", "mcp_server.feature_mcp"],
@@ -196,12 +260,39 @@ def create_client(project_dir: Path, model: str):
             },
         },
     }
+    if use_browser:
+        base_mcp_servers["playwright"] = {
+            "command": "npx",
+            "args": ["@playwright/mcp@latest", "--viewport-size", "1280x720"],
+        }
 
     # Load and merge project-specific MCP servers (e.g., Laravel Boost)
     project_mcp_servers = get_project_mcp_servers(project_dir)
     mcp_servers = {**base_mcp_servers, **project_mcp_servers}
+    allowed_tools, allow_rules = get_tool_permissions(tuple(mcp_servers))
 
-    print(f"Created security settings at {settings_file}")
+    # Create comprehensive security settings
+    security_settings = {
+        "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
+        "permissions": {
+            "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
+            # File operations and Bash within the project directory, plus the
+            # tools of the configured MCP servers (features, Playwright, Laravel Boost)
+            "allow": list(allow_rules),
+        },
+    }
+
+    # Ensure project directory exists before creating settings file
+    if project_dir not in _known_dirs:
+        project_dir.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(project_dir)
+
+    # Write settings to a file in the project directory
+    settings_file = project_dir / ".claude_settings.json"
+    if write_settings_file(settings_file, security_settings):
+        print(f"Created security settings at {settings_file}")
+    else:
+        print(f"Using existing security settings at {settings_file}")
     print("   - Sandbox enabled (OS-level bash isolation)")
     print(f"   - Filesystem restricted to: {project_dir.resolve()}")
     print("   - Bash commands restricted to allowlist (see security.py)")
@@ -215,12 +306,7 @@ def create_client(project_dir: Path, model: str):
             system_prompt="You are an expert full-stack developer building a production-quality web application.",
             setting_sources=["project"],  # Enable skills, commands, and CLAUDE.md from project dir
             max_buffer_size=10 * 1024 * 1024,  # 10MB for large Playwright screenshots
-            allowed_tools=[
-                *BUILTIN_TOOLS,
-                *PLAYWRIGHT_TOOLS,
-                *FEATURE_MCP_TOOLS,
-                *LARAVEL_BOOST_TOOLS,
-            ],
+            allowed_tools=list(allowed_tools),
             mcp_servers=mcp_servers,
             hooks={
                 "PreToolUse": [
@@ -15,75 +15,84 @@ Tools:
 - feature_create_bulk: Create multiple features at once
 """
 
-import json
+import asyncio
+import functools
+import io
+import itertools
 import os
+import random
 import sys
-from contextlib import asynccontextmanager
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Callable, Iterable, Iterator
 
+import orjson
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
-from sqlalchemy.sql.expression import func
+from pydantic import Field
+from sqlalchemy import case, func, text
+from sqlalchemy.orm import Session
 
 # Add parent directory to path so we can import from api module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.database import Feature, create_database
-from api.migration import migrate_json_to_sqlite, migrate_schema
+from api.migration import has_feature_fts, migrate_json_to_sqlite, migrate_schema
 
 # Configuration from environment
 PROJECT_DIR = Path(os.environ.get("PROJECT_DIR", ".")).resolve()
 
 
-# Pydantic models for input validation
-class MarkPassingInput(BaseModel):
-    """Input for marking a feature as passing."""
-    feature_id: int = Field(..., description="The ID of the feature to mark as passing", ge=1)
-
-
-class SkipFeatureInput(BaseModel):
-    """Input for skipping a feature."""
-    feature_id: int = Field(..., description="The ID of the feature to skip", ge=1)
-
-
-class RegressionInput(BaseModel):
-    """Input for getting regression features."""
-    limit: int = Field(default=3, ge=1, le=10, description="Maximum number of passing features to return")
-
+# Global database session maker (initialized on startup)
+_session_maker = None
+_engine = None
 
-class FeatureCreateItem(BaseModel):
-    """Schema for creating a single feature."""
-    category: str = Field(..., min_length=1, max_length=100, description="Feature category")
-    name: str = Field(..., min_length=1, max_length=255, description="Feature name")
-    description: str = Field(..., min_length=1, description="Detailed description")
-    steps: list[str] = Field(..., min_length=1, description="Implementation/test steps")
+# Whether the feature_fts full-text index is available (set on startup)
+_fts_enabled = False
 
+# Highest feature priority in the database, kept in memory so skips and
+# appends don't need a query (seeded on startup, 0 when there are no features)
+_max_priority = 0
+_priority_lock = threading.Lock()
 
-class BulkCreateInput(BaseModel):
-    """Input for bulk creating features."""
-    features: list[FeatureCreateItem] = Field(..., min_length=1, description="List of features to create")
+# Ids of passing features for regression sampling, or None when they need
+# to be reloaded (only feature_mark_passing changes which features pass)
+_passing_ids = None
 
+# Bumped after every write tool commits; read-only aggregate tools cache
+# their responses until it changes
+_table_version = 0
+_write_counter = itertools.count(1)
 
-# Global database session maker (initialized on startup)
-_session_maker = None
-_engine = None
+# The trigram tokenizer cannot match queries shorter than this
+FTS_MIN_QUERY_LENGTH = 3
 
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
     """Initialize database on startup, cleanup on shutdown."""
-    global _session_maker, _engine
+    global _session_maker, _engine, _fts_enabled, _max_priority, _passing_ids
 
     # Create project directory if it doesn't exist
     PROJECT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Initialize database
-    _engine, _session_maker = create_database(PROJECT_DIR)
+    # Initialize database (blocking I/O runs in worker threads to keep the
+    # event loop free)
+    _engine, _session_maker = await asyncio.to_thread(create_database, PROJECT_DIR)
 
-    # Run migrations if needed
-    migrate_json_to_sqlite(PROJECT_DIR, _session_maker)  # Legacy JSON to SQLite
-    migrate_schema(_session_maker)  # Add new columns to existing tables
+    # Run migrations if needed. These stay sequential: both write to the
+    # features table, so running them concurrently would only contend on
+    # SQLite's write lock, and the FTS rebuild must see imported rows.
+    await asyncio.to_thread(migrate_json_to_sqlite, PROJECT_DIR, _session_maker)  # Legacy JSON to SQLite
+    await asyncio.to_thread(migrate_schema, _session_maker)  # Add new columns to existing tables
+    _fts_enabled = await asyncio.to_thread(has_feature_fts, _session_maker)
+    _max_priority = await asyncio.to_thread(load_max_priority)
+
+    # Drop in-memory state derived from any previously opened database
+    _passing_ids = None
+    _feature_json_cache.clear()
+    mark_table_changed()
 
     yield
 
@@ -92,15 +101,97 @@ async def server_lifespan(server: FastMCP):
         _engine.dispose()
 
 
+def load_max_priority() -> int:
+    """Return the highest feature priority in the database (0 if empty)."""
+    with get_session() as session:
+        return session.query(func.max(Feature.priority)).scalar() or 0
+
+
 # Initialize the MCP server
 mcp = FastMCP("features", lifespan=server_lifespan)
 
 
-def get_session():
-    """Get a new database session."""
+def to_json(obj) -> str:
+    """Serialize a tool response as compact JSON (orjson, C-implemented).
+
+    Responses are read by the model, not humans, so indentation only adds
+    bytes on the stdio pipe and tokens in the context window.
+    """
+    return orjson.dumps(obj).decode()
+
+
+@contextmanager
+def get_session() -> Iterator[Session]:
+    """Provide a database session that is closed when the block exits."""
     if _session_maker is None:
         raise RuntimeError("Database not initialized")
-    return _session_maker()
+    session = _session_maker()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def mark_table_changed() -> None:
+    """Invalidate responses cached by @cached_until_write."""
+    global _table_version
+    _table_version = next(_write_counter)
+
+
+def cached_until_write(tool: Callable[[], str]) -> Callable[[], str]:
+    """Cache a read-only, argument-less tool's response until the next write."""
+    cache = None  # (table_version, response)
+
+    @functools.wraps(tool)
+    def wrapper() -> str:
+        nonlocal cache
+        version = _table_version
+        if cache is not None and cache[0] == version:
+            return cache[1]
+        response = tool()
+        cache = (version, response)
+        return response
+
+    return wrapper
+
+
+def features_response(items: Iterable[str]) -> str:
+    """Build a {"features": [...], "count": n} response from serialized items.
+
+    Items are written into the buffer as they are produced, so no list of
+    feature dicts is materialized alongside the serialized output.
+    """
+    buf = io.StringIO()
+    buf.write('{"features":[')
+    count = 0
+    for item in items:
+        if count:
+            buf.write(",")
+        buf.write(item)
+        count += 1
+    buf.write(f'],"count":{count}}}')
+    return buf.getvalue()
+
+
+# Serialized feature payloads, keyed by the fields that tools can change
+# (passes via feature_mark_passing, priority via feature_skip)
+FEATURE_JSON_CACHE_SIZE = 512
+_feature_json_cache: OrderedDict[tuple[int, bool, int], str] = OrderedDict()
+
+
+def feature_to_json(feature: Feature) -> str:
+    """Serialize a feature, reusing the cached JSON while it is unchanged."""
+    key = (feature.id, feature.passes, feature.priority)
+    cached = _feature_json_cache.get(key)
+    if cached is not None:
+        _feature_json_cache.move_to_end(key)
+        return cached
+
+    data = to_json(feature.to_dict())
+    _feature_json_cache[key] = data
+    if len(_feature_json_cache) > FEATURE_JSON_CACHE_SIZE:
+        _feature_json_cache.popitem(last=False)
+    return data
 
 
 @mcp.tool()
@@ -113,19 +204,18 @@ def feature_get_stats() -> str:
     Returns:
         JSON with: passing (int), total (int), percentage (float)
     """
-    session = get_session()
-    try:
-        total = session.query(Feature).count()
-        passing = session.query(Feature).filter(Feature.passes == True).count()
+    with get_session() as session:
+        total, passing = session.query(
+            func.count(Feature.id),
+            func.coalesce(func.sum(case((Feature.passes == True, 1), else_=0)), 0),
+        ).one()
         percentage = round((passing / total) * 100, 1) if total > 0 else 0.0
 
-        return json.dumps({
+        return to_json({
             "passing": passing,
             "total": total,
             "percentage": percentage
-        }, indent=2)
-    finally:
-        session.close()
+        })
 
 
 @mcp.tool()
@@ -139,8 +229,7 @@ def feature_get_next() -> str:
         JSON with feature details (id, priority, category, name, description, steps, passes)
         or error message if all features are passing.
     """
-    session = get_session()
-    try:
+    with get_session() as session:
         feature = (
             session.query(Feature)
             .filter(Feature.passes == False)
@@ -149,11 +238,9 @@ def feature_get_next() -> str:
         )
 
         if feature is None:
-            return json.dumps({"error": "All features are passing! No more work to do."})
+            return to_json({"error": "All features are passing! No more work to do."})
 
-        return json.dumps(feature.to_dict(), indent=2)
-    finally:
-        session.close()
+        return feature_to_json(feature)
 
 
 @mcp.tool()
@@ -172,25 +259,29 @@ def feature_get_for_regression(
     Returns:
         JSON with: features (list of feature objects), count (int)
     """
-    session = get_session()
-    try:
-        features = (
-            session.query(Feature)
-            .filter(Feature.passes == True)
-            .order_by(func.random())
-            .limit(limit)
-            .all()
-        )
-
-        return json.dumps({
-            "features": [f.to_dict() for f in features],
-            "count": len(features)
-        }, indent=2)
-    finally:
-        session.close()
+    global _passing_ids
+
+    with get_session() as session:
+        # Sample ids in Python rather than ORDER BY RANDOM(), which sorts every
+        # passing row. The id list is cached until a feature is marked passing.
+        passing_ids = _passing_ids
+        if passing_ids is None:
+            passing_ids = [
+                row[0] for row in session.query(Feature.id).filter(Feature.passes == True)
+            ]
+            _passing_ids = passing_ids
+        sample_ids = random.sample(passing_ids, min(limit, len(passing_ids)))
+        # IN returns rows in id order; restore the random sample order
+        by_id = {
+            f.id: f for f in session.query(Feature).filter(Feature.id.in_(sample_ids))
+        } if sample_ids else {}
+        features = [by_id[i] for i in sample_ids if i in by_id]
+
+        return features_response(feature_to_json(f) for f in features)
 
 
 @mcp.tool()
+@cached_until_write
 def feature_get_all_categories() -> str:
     """Get all unique feature categories currently in the database.
 
@@ -201,8 +292,7 @@ def feature_get_all_categories() -> str:
     Returns:
         JSON with: categories (list of strings), count (int)
     """
-    session = get_session()
-    try:
+    with get_session() as session:
         categories = (
             session.query(Feature.category)
             .distinct()
@@ -211,15 +301,14 @@ def feature_get_all_categories() -> str:
         )
         category_list = [c[0] for c in categories]
 
-        return json.dumps({
+        return to_json({
             "categories": category_list,
             "count": len(category_list)
-        }, indent=2)
-    finally:
-        session.close()
+        })
 
 
 @mcp.tool()
+@cached_until_write
 def feature_get_summary() -> str:
     """Get a summary of all features grouped by category.
 
@@ -230,10 +319,7 @@ def feature_get_summary() -> str:
     Returns:
         JSON with: categories (list of {name, total, passing}), overall (total, passing)
     """
-    session = get_session()
-    try:
-        from sqlalchemy import case
-
+    with get_session() as session:
         # Get counts by category
         category_stats = (
             session.query(
@@ -260,9 +346,7 @@ def feature_get_summary() -> str:
                 "passing": sum(r[2] for r in category_stats)
             }
         }
-        return json.dumps(result, indent=2)
-    finally:
-        session.close()
+        return to_json(result)
 
 
 @mcp.tool()
@@ -274,6 +358,7 @@ def feature_search(
 
     Helps check if a feature already exists before adding duplicates.
     Use this before creating new features to avoid redundancy.
+    Results are ranked by relevance when the full-text index is available.
 
     Args:
         query: Search term to match against feature names and descriptions
@@ -282,33 +367,45 @@ def feature_search(
     Returns:
         JSON with: features (list of {id, name, category, passes}), count (int)
     """
-    session = get_session()
-    try:
-        features = (
-            session.query(Feature)
-            .filter(
-                (Feature.name.ilike(f"%{query}%")) |
-                (Feature.description.ilike(f"%{query}%"))
+    with get_session() as session:
+        if _fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+            # Quote the query as a single FTS5 string so operators are literal
+            match = '"' + query.replace('"', '""') + '"'
+            ids = [
+                row[0]
+                for row in session.execute(
+                    text(
+                        "SELECT rowid FROM feature_fts WHERE feature_fts MATCH :match "
+                        "ORDER BY rank LIMIT :limit"
+                    ),
+                    {"match": match, "limit": limit},
+                )
+            ]
+            by_id = {
+                f.id: f for f in session.query(Feature).filter(Feature.id.in_(ids))
+            } if ids else {}
+            features = [by_id[i] for i in ids if i in by_id]
+        else:
+            features = (
+                session.query(Feature)
+                .filter(
+                    (Feature.name.ilike(f"%{query}%")) |
+                    (Feature.description.ilike(f"%{query}%"))
+                )
+                .order_by(Feature.priority.asc())
+                .limit(limit)
+                .all()
             )
-            .order_by(Feature.priority.asc())
-            .limit(limit)
-            .all()
-        )
 
-        return json.dumps({
-            "features": [
-                {
-                    "id": f.id,
-                    "name": f.name,
-                    "category": f.category,
-                    "passes": f.passes
-                }
-                for f in features
-            ],
-            "count": len(features)
-        }, indent=2)
-    finally:
-        session.close()
+        return features_response(
+            to_json({
+                "id": f.id,
+                "name": f.name,
+                "category": f.category,
+                "passes": f.passes
+            })
+            for f in features
+        )
 
 
 @mcp.tool()
@@ -326,20 +423,21 @@ def feature_mark_passing(
     Returns:
         JSON with the updated feature details, or error if not found.
     """
-    session = get_session()
-    try:
-        feature = session.query(Feature).filter(Feature.id == feature_id).first()
+    global _passing_ids
+
+    with get_session() as session:
+        feature = session.get(Feature, feature_id)
 
         if feature is None:
-            return json.dumps({"error": f"Feature with ID {feature_id} not found"})
+            return to_json({"error": f"Feature with ID {feature_id} not found"})
 
         feature.passes = True
         session.commit()
         session.refresh(feature)
+        _passing_ids = None  # Rebuilt on the next regression request
+        mark_table_changed()
 
-        return json.dumps(feature.to_dict(), indent=2)
-    finally:
-        session.close()
+        return feature_to_json(feature)
 
 
 @mcp.tool()
@@ -362,35 +460,35 @@ def feature_skip(
     Returns:
         JSON with skip details: id, name, old_priority, new_priority, message
     """
-    session = get_session()
-    try:
-        feature = session.query(Feature).filter(Feature.id == feature_id).first()
+    global _max_priority
+
+    with get_session() as session:
+        feature = session.get(Feature, feature_id)
 
         if feature is None:
-            return json.dumps({"error": f"Feature with ID {feature_id} not found"})
+            return to_json({"error": f"Feature with ID {feature_id} not found"})
 
         if feature.passes:
-            return json.dumps({"error": "Cannot skip a feature that is already passing"})
+            return to_json({"error": "Cannot skip a feature that is already passing"})
 
         old_priority = feature.priority
 
-        # Get max priority and set this feature to max + 1
-        max_priority_result = session.query(Feature.priority).order_by(Feature.priority.desc()).first()
-        new_priority = (max_priority_result[0] + 1) if max_priority_result else 1
-
-        feature.priority = new_priority
-        session.commit()
+        # Move this feature to max priority + 1
+        with _priority_lock:
+            new_priority = _max_priority + 1
+            feature.priority = new_priority
+            session.commit()
+            _max_priority = new_priority
+        mark_table_changed()
         session.refresh(feature)
 
-        return json.dumps({
+        return to_json({
             "id": feature.id,
             "name": feature.name,
             "old_priority": old_priority,
             "new_priority": new_priority,
             "message": f"Feature '{feature.name}' moved to end of queue"
-        }, indent=2)
-    finally:
-        session.close()
+        })
 
 
 @mcp.tool()
@@ -423,64 +521,69 @@ def feature_create_bulk(
     Returns:
         JSON with: created (int), priority_mode (str), start_priority (int)
     """
-    session = get_session()
-    try:
-        # Calculate starting priority based on mode
-        if priority_mode == "prepend":
-            # Get minimum priority of pending (non-passing) features
-            min_pending = (
-                session.query(Feature.priority)
-                .filter(Feature.passes == False)
-                .order_by(Feature.priority.asc())
-                .first()
-            )
-            if min_pending:
-                # Start before the first pending feature
-                start_priority = min_pending[0] - len(features)
-            else:
-                # No pending features, use normal append logic
-                max_priority_result = session.query(Feature.priority).order_by(Feature.priority.desc()).first()
-                start_priority = (max_priority_result[0] + 1) if max_priority_result else 1
-        else:
-            # Append mode: add after all existing features
-            max_priority_result = session.query(Feature.priority).order_by(Feature.priority.desc()).first()
-            start_priority = (max_priority_result[0] + 1) if max_priority_result else 1
-
-        created_count = 0
-        for i, feature_data in enumerate(features):
-            # Validate required fields
-            if not all(key in feature_data for key in ["category", "name", "description", "steps"]):
-                return json.dumps({
-                    "error": f"Feature at index {i} missing required fields (category, name, description, steps)"
-                })
-
-            db_feature = Feature(
-                priority=start_priority + i,
-                category=feature_data["category"],
-                name=feature_data["name"],
-                description=feature_data["description"],
-                steps=feature_data["steps"],
-                passes=False,
-                source=source,
-                batch_id=batch_id,
-            )
-            session.add(db_feature)
-            created_count += 1
-
-        session.commit()
-
-        return json.dumps({
-            "created": created_count,
-            "priority_mode": priority_mode,
-            "start_priority": start_priority,
-            "source": source,
-            "batch_id": batch_id
-        }, indent=2)
-    except Exception as e:
-        session.rollback()
-        return json.dumps({"error": str(e)})
-    finally:
-        session.close()
+    global _max_priority
+
+    # Validate every row before touching the database
+    required = ("category", "name", "description", "steps")
+    for i, feature_data in enumerate(features):
+        if not all(key in feature_data for key in required):
+            return to_json({
+                "error": f"Feature at index {i} missing required fields (category, name, description, steps)"
+            })
+
+    with get_session() as session:
+        try:
+            with _priority_lock:
+                # Calculate starting priority based on mode
+                min_pending = None
+                if priority_mode == "prepend":
+                    # Get minimum priority of pending (non-passing) features
+                    min_pending = (
+                        session.query(Feature.priority)
+                        .filter(Feature.passes == False)
+                        .order_by(Feature.priority.asc())
+                        .first()
+                    )
+                if min_pending:
+                    # Start before the first pending feature
+                    start_priority = min_pending[0] - len(features)
+                else:
+                    # Append mode (or nothing pending): add after all existing features
+                    start_priority = _max_priority + 1
+
+                # Insert all rows with a single executemany INSERT instead of
+                # per-object ORM unit-of-work bookkeeping
+                rows = [
+                    {
+                        "priority": start_priority + i,
+                        "category": feature_data["category"],
+                        "name": feature_data["name"],
+                        "description": feature_data["description"],
+                        "steps": feature_data["steps"],
+                        "passes": False,
+                        "source": source,
+                        "batch_id": batch_id,
+                    }
+                    for i, feature_data in enumerate(features)
+                ]
+                # An executemany with no rows would run a single INSERT of
+                # column defaults, so skip the database entirely
+                if rows:
+                    session.execute(Feature.__table__.insert(), rows)
+                    session.commit()
+                    _max_priority = max(_max_priority, start_priority + len(rows) - 1)
+                    mark_table_changed()
+
+            return to_json({
+                "created": len(rows),
+                "priority_mode": priority_mode,
+                "start_priority": start_priority,
+                "source": source,
+                "batch_id": batch_id
+            })
+        except Exception as e:
+            session.rollback()
+            return to_json({"error": str(e)})
 
 
 if __name__ == "__main__":
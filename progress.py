@@ -47,10 +47,10 @@ def has_features(project_dir: Path) -> bool:
     try:
         conn = sqlite3.connect(db_file)
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM features")
-        count = cursor.fetchone()[0]
+        cursor.execute("SELECT EXISTS(SELECT 1 FROM features)")
+        exists = cursor.fetchone()[0]
         conn.close()
-        return count > 0
+        return bool(exists)
     except Exception:
         # Database exists but can't be read or has no features table
         return False
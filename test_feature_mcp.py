@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Feature MCP Server Tests
+========================
+
+Tests for the feature management tools, run against a temporary database.
+Run with: python test_feature_mcp.py
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import api.migration as migration
+import mcp_server.feature_mcp as feature_mcp
+from api.database import Feature
+
+
+def make_feature(name: str, category: str = "general", description: str = "") -> dict:
+    """Build a feature dict as accepted by feature_create_bulk."""
+    return {
+        "category": category,
+        "name": name,
+        "description": description or f"Description of {name}",
+        "steps": ["Step 1"],
+    }
+
+
+def check(description: str, ok: bool, detail: str = "") -> bool:
+    """Print the result of a single check and return it."""
+    print(f"  {'PASS' if ok else 'FAIL'}: {description}")
+    if not ok and detail:
+        print(f"         {detail}")
+    return ok
+
+
+def with_fresh_database(test) -> list[bool]:
+    """Run test() with the MCP server started on an empty temporary project."""
+
+    async def run():
+        async with feature_mcp.server_lifespan(feature_mcp.mcp):
+            return test()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feature_mcp.PROJECT_DIR = Path(tmp)
+        return asyncio.run(run())
+
+
+def test_create_bulk_empty():
+    """Test that creating an empty batch is a no-op."""
+    print("\nTesting feature_create_bulk with no features:\n")
+
+    def body():
+        result = json.loads(feature_mcp.feature_create_bulk([]))
+        stats = json.loads(feature_mcp.feature_get_stats())
+        return [
+            check("returns created=0", result.get("created") == 0, f"Got: {result}"),
+            check("inserts no rows", stats["total"] == 0, f"Got: {stats}"),
+        ]
+
+    results = with_fresh_database(body)
+    return results.count(True), results.count(False)
+
+
+def search_ids(query: str) -> set[int]:
+    """Return the ids of features matched by feature_search."""
+    result = json.loads(feature_mcp.feature_search(query))
+    return {f["id"] for f in result["features"]}
+
+
+def test_search_index():
+    """Test that the full-text index follows inserts and name updates."""
+    print("\nTesting feature_search index sync:\n")
+
+    def body():
+        feature_mcp.feature_create_bulk([
+            make_feature("User login form", description="Authenticate with email"),
+            make_feature("Dashboard widget", description="Shows recent activity"),
+        ])
+        results = [
+            check("finds inserted feature by name", search_ids("login") == {1}),
+            check("matching is case-insensitive", search_ids("LOGIN") == {1}),
+            check("finds inserted feature by description", search_ids("recent activ") == {2}),
+        ]
+
+        with feature_mcp.get_session() as session:
+            session.get(Feature, 2).name = "Settings page"
+            session.commit()
+
+        results += [
+            check("finds updated name", search_ids("settings") == {2}),
+            check("drops old name", search_ids("dashboard") == set()),
+        ]
+        return results
+
+    results = with_fresh_database(body)
+    return results.count(True), results.count(False)
+
+
+def test_search_special_queries():
+    """Test short queries, quotes and the LIKE fallback."""
+    print("\nTesting feature_search special queries:\n")
+
+    def body():
+        feature_mcp.feature_create_bulk([
+            make_feature("QR code scanner"),
+            make_feature('Say "hello" button'),
+        ])
+        results = [
+            check("query under 3 characters", search_ids("qr") == {1}),
+            check("query with quotes", search_ids('"hello"') == {2}),
+            check("query with FTS operators", search_ids('a"b OR') == set()),
+        ]
+
+        feature_mcp._fts_enabled = False
+        results.append(check("LIKE fallback without FTS", search_ids("scanner") == {1}))
+        return results
+
+    results = with_fresh_database(body)
+    return results.count(True), results.count(False)
+
+
+def test_search_fts_failure():
+    """Test that a failed full-text index migration leaves no partial index."""
+    print("\nTesting feature_search after a failed index migration:\n")
+
+    sql_text = migration.text
+
+    def failing_text(sql: str):
+        # Fail partway through: after the table and triggers, at the backfill
+        if "'rebuild'" in sql:
+            raise RuntimeError("simulated failure")
+        return sql_text(sql)
+
+    def body():
+        feature_mcp.feature_create_bulk([make_feature("QR code scanner")])
+        with feature_mcp.get_session() as session:
+            leftovers = session.execute(
+                sql_text("SELECT name FROM sqlite_master WHERE name LIKE 'feature_fts%'")
+            ).all()
+        return [
+            check("full-text search disabled", not feature_mcp._fts_enabled),
+            check("no partial index left behind", leftovers == [], f"Got: {leftovers}"),
+            check("search falls back to LIKE", search_ids("scanner") == {1}),
+        ]
+
+    migration.text = failing_text
+    try:
+        results = with_fresh_database(body)
+    finally:
+        migration.text = sql_text
+    return results.count(True), results.count(False)
+
+
+def test_feature_json_cache():
+    """Test that cached feature JSON follows updates and database changes."""
+    print("\nTesting cached feature JSON:\n")
+
+    def first_database():
+        feature_mcp.feature_create_bulk([make_feature("Alpha")])
+        pending = json.loads(feature_mcp.feature_get_next())
+        passing = json.loads(feature_mcp.feature_mark_passing(1))
+        return [
+            check("serves pending feature", pending["passes"] is False, f"Got: {pending}"),
+            check("reflects feature_mark_passing", passing["passes"] is True, f"Got: {passing}"),
+        ]
+
+    def second_database():
+        feature_mcp.feature_create_bulk([make_feature("Beta")])
+        feature = json.loads(feature_mcp.feature_get_next())
+        return [
+            check("no stale JSON from previous database", feature["name"] == "Beta", f"Got: {feature}"),
+        ]
+
+    results = with_fresh_database(first_database) + with_fresh_database(second_database)
+    return results.count(True), results.count(False)
+
+
+def test_priorities_after_prepend():
+    """Test skip and append priorities around a prepended batch."""
+    print("\nTesting priorities after prepend:\n")
+
+    def body():
+        feature_mcp.feature_create_bulk([make_feature(f"Feature {i}") for i in range(3)])
+        feature_mcp.feature_mark_passing(1)
+
+        prepend = json.loads(feature_mcp.feature_create_bulk(
+            [make_feature("Urgent 1"), make_feature("Urgent 2")], priority_mode="prepend"
+        ))
+        next_feature = json.loads(feature_mcp.feature_get_next())
+        results = [
+            check("prepend starts before first pending", prepend["start_priority"] == 0, f"Got: {prepend}"),
+            check("prepended feature is next", next_feature["id"] == 4, f"Got: {next_feature}"),
+        ]
+
+        skip = json.loads(feature_mcp.feature_skip(4))
+        results.append(check("skip moves after max priority", skip["new_priority"] == 4, f"Got: {skip}"))
+
+        append = json.loads(feature_mcp.feature_create_bulk([make_feature("Later")]))
+        results.append(check("append follows skipped feature", append["start_priority"] == 5, f"Got: {append}"))
+
+        skip = json.loads(feature_mcp.feature_skip(5))
+        results.append(check("second skip moves after append", skip["new_priority"] == 6, f"Got: {skip}"))
+        return results
+
+    results = with_fresh_database(body)
+    return results.count(True), results.count(False)
+
+
+def regression_ids() -> set[int]:
+    """Return the ids of all features offered for regression testing."""
+    result = json.loads(feature_mcp.feature_get_for_regression(limit=10))
+    return {f["id"] for f in result["features"]}
+
+
+def test_regression_pool():
+    """Test that regression sampling sees newly passing features."""
+    print("\nTesting feature_get_for_regression:\n")
+
+    def body():
+        feature_mcp.feature_create_bulk([make_feature(f"Feature {i}") for i in range(3)])
+        results = [check("no passing features", regression_ids() == set())]
+
+        feature_mcp.feature_mark_passing(2)
+        results.append(check("includes feature just marked passing", regression_ids() == {2}))
+
+        feature_mcp.feature_mark_passing(3)
+        results.append(check("includes every passing feature", regression_ids() == {2, 3}))
+
+        # Rows must come back in sample order, not id order
+        sample = feature_mcp.random.sample
+        feature_mcp.random.sample = lambda population, k: sorted(population, reverse=True)[:k]
+        try:
+            result = json.loads(feature_mcp.feature_get_for_regression(limit=10))
+        finally:
+            feature_mcp.random.sample = sample
+        order = [f["id"] for f in result["features"]]
+        results.append(check("keeps the sampled order", order == [3, 2], f"Got: {order}"))
+        return results
+
+    results = with_fresh_database(body)
+    return results.count(True), results.count(False)
+
+
+def test_aggregate_caches():
+    """Test that category/summary responses are refreshed after writes."""
+    print("\nTesting feature_get_summary/feature_get_all_categories caching:\n")
+
+    def body():
+        feature_mcp.feature_create_bulk([make_feature("One", "a"), make_feature("Two", "a")])
+        summary = feature_mcp.feature_get_summary()
+        feature_mcp.feature_get_all_categories()
+        results = [
+            check("repeated summary is served from cache", feature_mcp.feature_get_summary() is summary),
+        ]
+
+        feature_mcp.feature_mark_passing(1)
+        summary = feature_mcp.feature_get_summary()
+        overall = json.loads(summary)["overall"]
+        results.append(check(
+            "summary updates after feature_mark_passing",
+            overall == {"total": 2, "passing": 1},
+            f"Got: {overall}",
+        ))
+
+        feature_mcp.feature_skip(2)
+        results.append(check(
+            "summary is recomputed after feature_skip",
+            feature_mcp.feature_get_summary() is not summary,
+        ))
+
+        feature_mcp.feature_create_bulk([make_feature("Three", "b")])
+        categories = json.loads(feature_mcp.feature_get_all_categories())["categories"]
+        overall = json.loads(feature_mcp.feature_get_summary())["overall"]
+        results += [
+            check("categories update after feature_create_bulk", categories == ["a", "b"], f"Got: {categories}"),
+            check(
+                "summary updates after feature_create_bulk",
+                overall == {"total": 3, "passing": 1},
+                f"Got: {overall}",
+            ),
+        ]
+        return results
+
+    results = with_fresh_database(body)
+    return results.count(True), results.count(False)
+
+
+def main():
+    print("=" * 70)
+    print("  FEATURE MCP TESTS")
+    print("=" * 70)
+
+    passed = 0
+    failed = 0
+
+    for test in (
+        test_create_bulk_empty,
+        test_search_index,
+        test_search_special_queries,
+        test_search_fts_failure,
+        test_feature_json_cache,
+        test_priorities_after_prepend,
+        test_regression_pool,
+        test_aggregate_caches,
+    ):
+        test_passed, test_failed = test()
+        passed += test_passed
+        failed += test_failed
+
+    # Summary
+    print("\n" + "-" * 70)
+    print(f"  Results: {passed} passed, {failed} failed")
+    print("-" * 70)
+
+    if failed == 0:
+        print("\n  ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n  {failed} TEST(S) FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())